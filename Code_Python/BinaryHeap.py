@@ -8,6 +8,10 @@ Notes
 -----
 - Written and tested in Python 3.8.5.
 - Min/max binary heap data structure implementation using Python lists.
+- The sift loops are delegated to the C-implemented <heapq> module (the
+  max-heap uses the corresponding internal <heapq> helpers).
+- The <heapq> helpers matching the heap type are bound once when the heap
+  is created or reversed, so put/get do not branch on the type per call.
 - The root item of the binary heap is at the front of the list.
 - Duplicates items are allowed but there is no guarantee which one is returned
   first (this may be important if the item contains multiple data).
@@ -16,8 +20,6 @@ Notes
 - Examples of usage are at the end of the file.
 - Reference: "Problem Solving with Algorithms and Data Structures", by Miller
   and Ranum.
-- find_min_max() is an helper function that returns the index of the node with
-  the max/min value between the two children nodes of the same parent node.
 
 
 BinaryHeap Class
@@ -28,8 +30,6 @@ size            Length of the binary heap.
 __init__()      Initializes the binary heap.
 __repr_()       Returns the string representation of the binary heap.
 is_empty()      Checks if the binary heap is empty or not.
-swap_up()       Swaps an item up to preserve the binary heap property.
-swap_down()     Swaps an item down to preserve the binary heap property.
 put()           Adds one item to the binary heap.
 get()           Returns and removes the item at the root of the binary heap.
 peek()          Returns the item at the root of the binary heap.
@@ -37,29 +37,20 @@ reverse()       Reverses the binary heap (from min to max and viceversa).
 clear()         Removes all items from the binary heap.
 """
 
+import heapq
 
-def find_min_max(items, idx, heap_type):
-    """
-    Returns the index of the node with the max/min value between two children.
-    """
-    size = len(items) - 1
-    left = 2 * idx
-    right = 2 * idx + 1
-
-    # if only one child it must be the left node
-    if (right > size):
-        return left
-
-    # Check if the left node has the max/min value
-    if (heap_type == 'max'):
-        flag = items[left] > items[right]
-    else:
-        flag = items[left] < items[right]
+# Max-heap counterparts of the public <heapq> functions (C-implemented too)
+_heapify_max = heapq._heapify_max
+_heappop_max = heapq._heappop_max
+_siftdown_max = heapq._siftdown_max
 
-    # Assign the index with the max/min
-    ic = left if (flag) else right
 
-    return ic
+def _heappush_max(items, item):
+    """
+    Max-heap counterpart of <heapq.heappush>.
+    """
+    items.append(item)
+    _siftdown_max(items, 0, len(items) - 1)
 
 
 class BinaryHeap:
@@ -70,30 +61,41 @@ class BinaryHeap:
         """
         Initializes the binary heap.
         """
-        self.heap_type = heap_type
+        self._set_heap_type(heap_type)
 
         # Initialize to an empty list
         if (init_list is None):
 
-            self.items = [0]
+            self.items = []
             self.size = 0
 
-        # Initialize to the initial list
+        # Initialize to the initial list (heapified in C in a single call)
         else:
 
-            self.items = [0] + init_list[:]
+            self.items = init_list[:]
             self.size = len(init_list)
+            self._heapify(self.items)
+
+    def _set_heap_type(self, heap_type):
+        """
+        Sets the heap type and binds the corresponding <heapq> helpers.
+        """
+        self.heap_type = heap_type
 
-            idx = self.size // 2
-            while (idx > 0):
-                self.swap_down(idx)
-                idx -= 1
+        if (heap_type == 'max'):
+            self._push = _heappush_max
+            self._pop = _heappop_max
+            self._heapify = _heapify_max
+        else:
+            self._push = heapq.heappush
+            self._pop = heapq.heappop
+            self._heapify = heapq.heapify
 
     def __repr__(self):
         """
         Returns the string representation of the binary heap.
         """
-        return ("{}".format(self.items[1:]))
+        return ("{}".format(self.items))
 
     def is_empty(self):
         """
@@ -101,70 +103,14 @@ class BinaryHeap:
         """
         return not self.size
 
-    def swap_up(self, ic):
-        """
-        Swaps an item up to preserve the heap property.
-
-        - min heap: swaps up if the content of the child node is lower then
-                    the content of the parent node.
-        - max heap: swaps up if the content of the child node is greater then
-                    the content of the parent node.
-        """
-        while ((ic // 2) > 0):
-
-            ip = ic // 2        # Index of the parent node
-
-            # Check if the swap condition is satisfied
-            if (self.heap_type == 'max'):
-                swap = (self.items[ic] > self.items[ip])        # max heap
-            else:
-                swap = (self.items[ic] < self.items[ip])        # min heap
-
-            # Swap the two nodes
-            if (swap):
-                self.items[ip], self.items[ic] = self.items[ic], self.items[ip]
-
-            # Next parent-child pair
-            ic = ip
-
-    def swap_down(self, ip):
-        """
-        Swaps an item down to preserve the heap property.
-
-        - min heap: swaps down if the content of the parent node is greater
-                    then the content of the child node.
-        - max heap: swaps down if the content of the parent node is lesser
-                    then the content of the child node.
-        """
-        while ((2 * ip) <= self.size):
-
-            # Index of the node with the max/min value between the children
-            ic = find_min_max(self.items, ip, self.heap_type)
-
-            # Check if the swap condition is satisfied
-            if (self.heap_type == 'max'):
-                swap = (self.items[ip] < self.items[ic])        # max heap
-            else:
-                swap = (self.items[ip] > self.items[ic])        # min heap
-
-            # Swap the two nodes
-            if (swap):
-                self.items[ip], self.items[ic] = self.items[ic], self.items[ip]
-
-            # Next parent-child pair
-            ip = ic
-
     def put(self, item):
         """
         Adds one item to the heap preserving the heap property.
         """
-        # Add the item at the end of the heap.
-        self.items.append(item)
+        # Add the item at the end of the heap and sift it up
+        self._push(self.items, item)
         self.size += 1
 
-        # Swap up the added item
-        self.swap_up(self.size)
-
     def get(self):
         """
         Returns and removes the item at the root of the binary heap preserving
@@ -177,18 +123,10 @@ class BinaryHeap:
         # If the list is not empty
         else:
 
-            # Save the item at the root
-            root_item = self.items[1]
-
-            # Move the last item in the binary heap to the root
-            self.items[1] = self.items[-1]
-            self.items.pop()
             self.size -= 1
 
-            # Swap down the item at the root
-            self.swap_down(1)
-
-            return root_item
+            # Remove the root item and sift down its replacement
+            return self._pop(self.items)
 
     def peek(self):
         """
@@ -201,25 +139,20 @@ class BinaryHeap:
 
         # If the list is not empty
         else:
-            return self.items[1]
+            return self.items[0]
 
     def reverse(self):
         """
         Reverses the binary heap (from min to max and viceversa).
         """
-        self.heap_type = 'min' if (self.heap_type == 'max') else 'max'
-
-        idx = self.size // 2
-        while (idx > 0):
-            self.swap_down(idx)
-            idx -= 1
+        self._set_heap_type('min' if (self.heap_type == 'max') else 'max')
+        self._heapify(self.items)
 
     def clear(self):
         """
         Removes all items from the binary heap.
         """
         self.items.clear()
-        self.items = [0]
         self.size = 0
 
 
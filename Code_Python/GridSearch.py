@@ -9,9 +9,9 @@ Notes
 - Written and tested in Python 3.8.5.
 - Two-dimensional grid search implementation using Depth First Search, Breath
   First Search, A* algorithm, and Dijkstra's algorithm.
-- DFS uses a stack as data structure.
-- BFS uses a queue as data structure.
-- A* uses a priority queue as data structure and f-values as priority.
+- DFS uses a plain list as stack.
+- BFS uses a deque as queue.
+- A* uses a binary heap (heapq) as data structure and f-values as priority.
 - Dijkstra uses a binary heap as data structure and g-values as priority.
 - Any offset can be defined but only 1-step motion is allowed.
 - Start and goal positions can be changed dynamically.
@@ -23,12 +23,19 @@ Notes
 
 GridSearch Class
 ----------------
-layout              List of lists with the grid layout.
-bound               List of lists with the grid boundaries.
+layout              2D array (uint8) with the grid layout cell codes.
+wall                2D array (bool) with the positions that cannot be entered.
+row_min             Array with the first wall column of each row.
+row_max             Array with the last wall column of each row.
+row_len             Array with the real (unpadded) length of each row.
+col_min             Array with the first wall row of each column.
+col_max             Array with the last wall row of each column.
+col_count           Array with the number of walls in each column.
 start               Tuple with the start position.
 goal                Tuple with the goal position.
 offset              List with the offset in each allowed direction.
 prob                List with the probabilities of each direction.
+rng                 Random generator used for the direction order.
 __init__()          Initializes the grid object.
 show()              Shows the grid layout.
 is_valid()          Checks if a position is inside the grid.
@@ -45,13 +52,22 @@ A_star()            Find the path using A* algorithm.
 Dijkstra()          Find the path using Dijkstra's algorithm.
 """
 
+from collections import deque
+from heapq import heappush, heappop
+from itertools import count
+
 import numpy as np
 
-from Stack import Stack
-from Queue import Queue
-from PriorityQueue import PriorityQueue
 from BinaryHeap import BinaryHeap
 
+# Cell codes (ASCII values) used in the grid layout
+EMPTY = ord(' ')
+WALL = ord('*')
+OBSTACLE = ord('#')
+START = ord('S')
+GOAL = ord('G')
+PATH = 183              # Middle-dot character used to show the path
+
 
 class GridSearch:
     """
@@ -61,27 +77,63 @@ class GridSearch:
         """
         Initialize the grid object.
         """
-        # Open and read the grid layout
+        # Open and read the grid layout in a single shot
         try:
-            fid = open(file_name, "r")
-            self.layout = [[char for char in line.strip("\n")] for line in fid]
+            fid = open(file_name, "rb")
+            data = fid.read()
             fid.close()
 
         except IOError:
             raise SystemExit("\nFile not found or problem during reading")
 
-        # Define a list containing the positions of the the grid boundaries
-        self.bound = []
-        for i, row in enumerate(self.layout):
-            self.bound.append([i for i, x in enumerate(row) if x == "*"])
-            if (len(self.bound[i]) <= 1):
-                raise SystemExit("\nThe grid bounds are not consistent.")
+        # Store the layout as a 2D array with one cell code (byte) per cell;
+        # the file is parsed with C-level bytes operations and, since the
+        # cell codes are the ASCII values, no mapping is needed
+        rows = data.split(b"\n")
+        if (rows and not rows[-1]):
+            rows.pop()                      # Trailing newline at the EOF
+        n_cols = max(len(row) for row in rows)
+
+        # Pad short rows with the wall code so the phantom cells outside the
+        # real grid can never be entered; the real row lengths are kept so
+        # show() can skip the padding
+        self.row_len = np.array([len(row) for row in rows])
+        grid = b"".join(row.ljust(n_cols, b'*') for row in rows)
+        self.layout = np.frombuffer(grid, dtype=np.uint8) \
+                        .reshape(-1, n_cols).copy()
+
+        # Mask with the positions that cannot be entered (walls/obstacles)
+        self.wall = (self.layout == WALL) | (self.layout == OBSTACLE)
+
+        # Precompute the first/last wall column of each row, ignoring the
+        # padding cells beyond the real end of each row (the walls are
+        # static, so together with the layout they fully define the grid
+        # boundaries); every row needs at least two walls to be consistent
+        real = np.arange(n_cols) < self.row_len[:, None]
+        walls = (self.layout == WALL) & real
+        if (np.any(walls.sum(axis=1) <= 1)):
+            raise SystemExit("\nThe grid bounds are not consistent.")
+        self.row_min = np.argmax(walls, axis=1).astype(np.int16)
+        self.row_max = (n_cols - 1 -
+                        np.argmax(walls[:, ::-1], axis=1)).astype(np.int16)
+
+        # Same for the first/last wall row of each column; the wall count is
+        # kept as well since a column may have no walls at all (the rows are
+        # already checked above)
+        n_rows = self.layout.shape[0]
+        self.col_count = walls.sum(axis=0).astype(np.int16)
+        self.col_min = np.argmax(walls, axis=0).astype(np.int16)
+        self.col_max = (n_rows - 1 -
+                        np.argmax(walls[::-1], axis=0)).astype(np.int16)
 
         # Init other attributes
         self.start = None
+        self.start_idx = None
         self.goal = None
+        self.goal_idx = None
         self.offset = None
         self.prob = None
+        self.rng = np.random.default_rng()
 
     def show(self, path=None):
         """
@@ -90,47 +142,42 @@ class GridSearch:
         # Add the path to the layout (if given)
         if (path is not None):
             for row, col in path[1:-1]:
-                self.layout[row][col] = chr(183)
+                self.layout[row, col] = PATH
 
-        # Show the layout
-        for row in self.layout:
-            for char in row:
-                print(char, end=' ')
+        # Show the layout (mapping the cell codes back to characters and
+        # skipping the padding cells)
+        for row, n in zip(self.layout, self.row_len):
+            for char in row[:n]:
+                print(chr(char), end=' ')
             print()
 
         # Remove the path from the layout (if given)
         if (path is not None):
             for row, col in path[1:-1]:
-                self.layout[row][col] = ' '
+                self.layout[row, col] = EMPTY
 
     def is_valid(self, row, col):
         """
         Returns <True> if (row, col) is inside the grid. Returns <False> if not.
         """
-        max_rows = len(self.bound)
-
         # Check if <row> is a valid row
-        if (row >= max_rows or row <= 0):
+        if (row >= self.layout.shape[0] or row <= 0):
             return False
 
         # Check if <col> is correctly bounded by walls
-        if (col > max(self.bound[row]) or col < min(self.bound[row])):
+        if (col > self.row_max[row] or col < self.row_min[row]):
             return False
 
-        # Build the column corresponding to <col> and check if it is valid
-        column = []
-        for i, k in enumerate(self.bound):
-            if (col in k):
-                column.append(i)
-        if (len(column) <= 1):
+        # Check if the column corresponding to <col> is valid
+        if (self.col_count[col] <= 1):
             raise SystemExit("\nThe grid bounds are not consistent.")
 
         # Check if <row> is correctly bounded by walls
-        if (row > max(column) or row < min(column)):
+        if (row > self.col_max[col] or row < self.col_min[col]):
             return False
 
         # Check if the position is a wall
-        if (self.layout[row][col] == '*'):
+        if (self.layout[row, col] == WALL):
             return False
 
         return True
@@ -144,11 +191,12 @@ class GridSearch:
 
             # If present remove the current start position
             if (self.start is not None):
-                self.layout[self.start[0]][self.start[1]] = ' '
+                self.layout[self.start[0], self.start[1]] = EMPTY
 
-            # Set the new start position
+            # Set the new start position (also stored as a flat index)
             self.start = (row, col)
-            self.layout[row][col] = 'S'
+            self.start_idx = row * self.layout.shape[1] + col
+            self.layout[row, col] = START
 
         # Raise an error if it is outside
         else:
@@ -163,11 +211,12 @@ class GridSearch:
 
             # If present remove the current goal position
             if (self.goal is not None):
-                self.layout[self.goal[0]][self.goal[1]] = ' '
+                self.layout[self.goal[0], self.goal[1]] = EMPTY
 
-            # Set the new goal position
+            # Set the new goal position (also stored as a flat index)
             self.goal = (row, col)
-            self.layout[row][col] = 'G'
+            self.goal_idx = row * self.layout.shape[1] + col
+            self.layout[row, col] = GOAL
 
         # Raise an error if it is outside
         else:
@@ -179,7 +228,8 @@ class GridSearch:
         """
         # Check if it is inside and add the obstacle
         if (self.is_valid(row, col)):
-            self.layout[row][col] = '#'
+            self.layout[row, col] = OBSTACLE
+            self.wall[row, col] = True
 
         # Raise an error if it is outside
         else:
@@ -191,7 +241,8 @@ class GridSearch:
         """
         # Check if it is inside and remove the obstacle
         if (self.is_valid(row, col)):
-            self.layout[row][col] = ' '
+            self.layout[row, col] = EMPTY
+            self.wall[row, col] = False
 
         # Raise an error if it is outside
         else:
@@ -204,85 +255,118 @@ class GridSearch:
         self.offset = offset
         self.prob = prob
 
+        # Offsets as an array for vectorized neighbour generation, also
+        # specialized to flat index increments for this grid
+        self.offset_arr = np.asarray(offset, dtype=np.int64)
+        self.flat_offset = (self.offset_arr[:, 0] * self.layout.shape[1] +
+                            self.offset_arr[:, 1])
+
+        # Precompute the direction indexes and the log-probabilities used
+        # by order_dir (zero probabilities map to -inf and are ordered last)
+        self.dir_idx = np.arange(len(offset))
+        if (prob is None):
+            self.log_prob = None
+        else:
+            with np.errstate(divide='ignore'):
+                self.log_prob = np.log(prob)
+
     def order_dir(self):
         """
         Returns the direction order using the given probabilities. If no
         probabilities, uses the same order specified as in <self.offset>.
         """
-        n = len(self.offset)
-        idx = np.arange(n)
+        if (self.log_prob is None):
+            return self.dir_idx
 
-        if (self.prob is not None):
-            idx = np.random.choice(idx, size=n, replace=False, p=self.prob)
+        # Weighted order without replacement using the Gumbel trick (the
+        # larger the perturbed log-probability the earlier the direction)
+        keys = self.log_prob + self.rng.gumbel(size=self.log_prob.size)
 
-        return idx
+        return np.argsort(-keys)
 
     def get_path(self, previous):
         """
         Returns the path between the start and the goal position.
         """
-        current = self.goal
-        path = []
-
-        # Loop until the start (its predecessor is <None>)
-        while (current is not None):
-            path.append(current)
+        n_cols = self.layout.shape[1]
+        buffer = np.empty(previous.size, dtype=np.int32)
+
+        # Walk the flat predecessor indexes back from the goal (the start
+        # is marked with -2)
+        current = self.goal[0] * n_cols + self.goal[1]
+        n = 0
+        while (current >= 0):
+            buffer[n] = current
+            n += 1
             current = previous[current]
 
-        # Reverse the order
-        path.reverse()
+        # Reverse the order and decode to (row, col) positions
+        idx = buffer[:n][::-1]
 
-        return path
+        return list(zip(*divmod(idx, n_cols)))
 
     def dfs(self):
         """
         Returns the path from the start position to the goal position using
         depth first search (DFS). Returns <None> if no solution is found.
         """
-        # Initialize the stack
-        stack = Stack()
+        # Initialize the stack (a plain list with the top at the back)
+        stack = []
+
+        # Array with the flat predecessor index of each visited position
+        # (-1 = not visited yet)
+        n_rows, n_cols = self.layout.shape
+        previous = np.full(n_rows * n_cols, -1, dtype=np.int32)
+
+        # Add the start point to the stack (marking it as the path origin)
+        stack.append(self.start_idx)
+        previous[self.start_idx] = -2
+        added = 1
 
-        # Add the start point to the stack
-        stack.push(self.start)
-        previous = {self.start: None}
-        self.added = 1
+
+        # Hoist constant attributes to locals (used in the hot loop); the
+        # direction order is fixed when no probabilities are given, so it
+        # is computed only once
+        wall = self.wall.ravel()
+        flat_offset = self.flat_offset
+        goal_idx = self.goal_idx
+        fixed_order = self.order_dir() if (self.prob is None) else None
 
         # Loop until the stack is empty
-        self.visited = 0
-        while (not stack.is_empty()):
+        visited = 0
+        while (stack):
 
             # Get the last position from the stack
             current = stack.pop()
-            self.visited += 1
+            visited += 1
 
             # Stop if it is the goal and return the path
-            if (current == self.goal):
+            if (current == goal_idx):
+                self.visited = visited
+                self.added = added
                 path = self.get_path(previous)
                 return path
 
             # Define the order in the directions
-            idx = self.order_dir()
+            idx = fixed_order if (fixed_order is not None) else self.order_dir()
+
+            # Compute all the neighbour positions and their validity at once
+            idx_neigh = current + flat_offset
+            valid = ~wall[idx_neigh] & (previous[idx_neigh] == -1)
 
             # Add to the stack the neighbours of the current position
             for direction in idx:
 
-                # Offset values
-                row_offset, col_offset = self.offset[direction]
+                # If the neighbour position is valid and not visited yet
+                if (valid[direction]):
 
-                # Neighbour position
-                row_neigh = current[0] + row_offset
-                col_neigh = current[1] + col_offset
-                neighbour = (row_neigh, col_neigh)
+                    # Add it to the stack (as a flat index)
+                    stack.append(idx_neigh[direction])
+                    previous[idx_neigh[direction]] = current
+                    added += 1
 
-                # If neighbour position is valid and not in the dictionary
-                if (self.layout[row_neigh][col_neigh] != '#' and
-                    self.layout[row_neigh][col_neigh] != '*' and
-                    neighbour not in previous):
-
-                    # Add it to the queue
-                    stack.push(neighbour)
-                    previous[neighbour] = current
-                    self.added += 1
+        self.visited = visited
+        self.added = added
 
         return None
 
@@ -291,50 +375,63 @@ class GridSearch:
         Returns the path from the start position to the goal position using
         breath first search (BFS). Returns <None> if no solution is found.
         """
-        # Initialize the queue
-        queue = Queue()
+        # Initialize the queue (a deque, with O(1) append and popleft)
+        queue = deque()
+
+        # Array with the flat predecessor index of each visited position
+        # (-1 = not visited yet)
+        n_rows, n_cols = self.layout.shape
+        previous = np.full(n_rows * n_cols, -1, dtype=np.int32)
 
-        # Add the start point to the queue
-        queue.enqueue(self.start)
-        previous = {self.start: None}
-        self.added = 1
+        # Add the start point to the queue (marking it as the path origin)
+        queue.append(self.start_idx)
+        previous[self.start_idx] = -2
+        added = 1
+
+
+        # Hoist constant attributes to locals (used in the hot loop); the
+        # direction order is fixed when no probabilities are given, so it
+        # is computed only once
+        wall = self.wall.ravel()
+        flat_offset = self.flat_offset
+        goal_idx = self.goal_idx
+        fixed_order = self.order_dir() if (self.prob is None) else None
 
         # Loop until the queue is empty
-        self.visited = 0
-        while (not queue.is_empty()):
+        visited = 0
+        while (queue):
 
             # Get the last item from the queue
-            current = queue.dequeue()
-            self.visited += 1
+            current = queue.popleft()
+            visited += 1
 
             # Stop if it is the goal and return the path
-            if (current == self.goal):
+            if (current == goal_idx):
+                self.visited = visited
+                self.added = added
                 path = self.get_path(previous)
                 return path
 
             # Define the order in the directions
-            idx = self.order_dir()
+            idx = fixed_order if (fixed_order is not None) else self.order_dir()
+
+            # Compute all the neighbour positions and their validity at once
+            idx_neigh = current + flat_offset
+            valid = ~wall[idx_neigh] & (previous[idx_neigh] == -1)
 
             # Add to the queue the neighbours of the current position
             for direction in idx:
 
-                # Offset values
-                row_offset, col_offset = self.offset[direction]
-
-                # Neighbour position
-                row_neigh = current[0] + row_offset
-                col_neigh = current[1] + col_offset
-                neighbour = (row_neigh, col_neigh)
+                # If the neighbour position is valid and not visited yet
+                if (valid[direction]):
 
-                # If neighbour position is valid and not in the dictionary
-                if (self.layout[row_neigh][col_neigh] != '#' and
-                    self.layout[row_neigh][col_neigh] != '*' and
-                    neighbour not in previous):
+                    # Add it to the queue (as a flat index)
+                    queue.append(idx_neigh[direction])
+                    previous[idx_neigh[direction]] = current
+                    added += 1
 
-                    # Add it to the queue
-                    queue.enqueue(neighbour)
-                    previous[neighbour] = current
-                    self.added += 1
+        self.visited = visited
+        self.added = added
 
         return None
 
@@ -355,63 +452,81 @@ class GridSearch:
 
             return dist
 
-        # Initialize the priority queue
-        pq = PriorityQueue(queue_type='min')
+        # Initialize the priority queue (a heapq list with a tie-breaking
+        # counter so positions with equal f-value come out in FIFO order)
+        pq = []
+        counter = count()
 
         # Values for the start point
         g = 0
         h = heuristic(self.goal, self.start)
         f = g + h
 
-        # Add the start point to the priority queue.
-        pq.put(f, self.start)
-        g_values = {self.start: g}
-        previous = {self.start: None}
-        self.added = 1
+        # Arrays with the flat predecessor index of each visited position
+        # (-1 = not visited yet) and with the g-values
+        n_rows, n_cols = self.layout.shape
+        previous = np.full(n_rows * n_cols, -1, dtype=np.int32)
+        g_values = np.zeros(n_rows * n_cols, dtype=np.int32)
+
+        # Add the start point to the priority queue (marking it as the path
+        # origin)
+        heappush(pq, (f, next(counter), self.start_idx))
+        previous[self.start_idx] = -2
+        added = 1
+
+
+        # Hoist constant attributes to locals (used in the hot loop); the
+        # direction order is fixed when no probabilities are given, so it
+        # is computed only once
+        wall = self.wall.ravel()
+        flat_offset = self.flat_offset
+        goal_idx = self.goal_idx
+        goal = self.goal
+        fixed_order = self.order_dir() if (self.prob is None) else None
 
         # Loop until the priority queue is empty
-        self.visited = 0
-        while (not pq.is_empty()):
+        visited = 0
+        while (pq):
 
             # Get the highest priority position from the priority queue
-            f, current = pq.get()
-            self.visited += 1
+            f, _, current = heappop(pq)
+            visited += 1
 
             # Stop if it is the goal and return the path
-            if (current == self.goal):
+            if (current == goal_idx):
+                self.visited = visited
+                self.added = added
                 path = self.get_path(previous)
                 return path
 
             # Define the order in the directions
-            idx = self.order_dir()
+            idx = fixed_order if (fixed_order is not None) else self.order_dir()
+
+            # Compute all the neighbour positions and their validity at once
+            idx_neigh = current + flat_offset
+            valid = ~wall[idx_neigh] & (previous[idx_neigh] == -1)
 
             # Add to the priority queue the neighbours of the current position
             for direction in idx:
 
-                # Offset values
-                row_offset, col_offset = self.offset[direction]
-
-                # Neighbour position
-                row_neigh = current[0] + row_offset
-                col_neigh = current[1] + col_offset
-                neighbour = (row_neigh, col_neigh)
-
-                # If neighbour position is valid and not in the dictionary
-                if (self.layout[row_neigh][col_neigh] != '#' and
-                    self.layout[row_neigh][col_neigh] != '*' and
-                    neighbour not in previous):
+                # If the neighbour position is valid and not visited yet
+                if (valid[direction]):
 
                     # Values (the g-value of all neighbour positions differ
                     # from the g-value of the current position by 1)
+                    neighbour = divmod(idx_neigh[direction], n_cols)
                     g = g_values[current] + 1
-                    h = heuristic(self.goal, neighbour)
+                    h = heuristic(goal, neighbour)
                     f = g + h
 
-                    # Add it to the priority queue
-                    pq.put(f, neighbour)
-                    g_values[neighbour] = g
-                    previous[neighbour] = current
-                    self.added += 1
+                    # Add it to the priority queue (as a flat index)
+                    heappush(pq, (f, next(counter), idx_neigh[direction]))
+                    g_values[idx_neigh[direction]] = g
+                    previous[idx_neigh[direction]] = current
+                    added += 1
+
+        self.visited = visited
+        self.added = added
 
         return None
 
@@ -424,53 +539,71 @@ class GridSearch:
         # Initialize the binary heap
         bh = BinaryHeap(heap_type='min')
 
-        # Add the start point to the binary heap.
+        # Arrays with the flat predecessor index of each visited position
+        # (-1 = not visited yet) and with the g-values, initialized to
+        # "infinity" so that any computed g-value improves on them
+        n_rows, n_cols = self.layout.shape
+        previous = np.full(n_rows * n_cols, -1, dtype=np.int32)
+        g_values = np.full(n_rows * n_cols, np.iinfo(np.int32).max,
+                           dtype=np.int32)
+
+        # Add the start point to the binary heap (marking it as the path
+        # origin)
         g = 0
-        bh.put((g, self.start))
-        g_values = {self.start: g}
-        previous = {self.start: None}
-        self.added = 1
+        bh.put((g, self.start_idx))
+        g_values[self.start_idx] = g
+        previous[self.start_idx] = -2
+        added = 1
+
+
+        # Hoist constant attributes to locals (used in the hot loop); the
+        # direction order is fixed when no probabilities are given, so it
+        # is computed only once
+        wall = self.wall.ravel()
+        flat_offset = self.flat_offset
+        goal_idx = self.goal_idx
+        fixed_order = self.order_dir() if (self.prob is None) else None
 
         # Loop until the priority queue is empty
-        self.visited = 0
+        visited = 0
         while (not bh.is_empty()):
 
             # Get the highest priority position from the priority queue
             (g, current) = bh.get()
-            self.visited += 1
+            visited += 1
 
             # Stop if it is the goal and return the path
-            if (current == self.goal):
+            if (current == goal_idx):
+                self.visited = visited
+                self.added = added
                 path = self.get_path(previous)
                 return path
 
             # Define the order in the directions
-            idx = self.order_dir()
+            idx = fixed_order if (fixed_order is not None) else self.order_dir()
 
-            # Add to the binary heap the neighbours of the current position
-            for direction in idx:
+            # g-value of all the neighbours of the current position (they
+            # differ from the g-value of the current position by 1)
+            g = g_values[current] + 1
 
-                # Offset values
-                row_offset, col_offset = self.offset[direction]
+            # Compute all the neighbour positions and their validity at once
+            # (a neighbour is pushed only if its g-value improves)
+            idx_neigh = current + flat_offset
+            valid = ~wall[idx_neigh] & (g < g_values[idx_neigh])
 
-                # Neighbour position
-                row_neigh = current[0] + row_offset
-                col_neigh = current[1] + col_offset
-                neighbour = (row_neigh, col_neigh)
+            # Add to the binary heap the neighbours of the current position
+            for direction in idx:
 
-                # If neighbour position is valid and not in the dictionary
-                if (self.layout[row_neigh][col_neigh] != '#' and
-                    self.layout[row_neigh][col_neigh] != '*' and
-                    neighbour not in previous):
+                # If the neighbour position is valid and not visited yet
+                if (valid[direction]):
 
-                    # Values (the g-value of all neighbour positions differ
-                    # from the g-value of the current position by 1)
-                    g = g_values[current] + 1
+                    # Add it to the binary heap (as a flat index)
+                    bh.put((g, idx_neigh[direction]))
+                    g_values[idx_neigh[direction]] = g
+                    previous[idx_neigh[direction]] = current
+                    added += 1
 
-                    # Add it to the priority queue
-                    bh.put((g, neighbour))
-                    g_values[neighbour] = g
-                    previous[neighbour] = current
-                    self.added += 1
+        self.visited = visited
+        self.added = added
 
         return None
@@ -0,0 +1,267 @@
+"""
+Indexed Priority Queue Data Structure Using Lists
+
+Copyright (c) 2020 Gabriele Gilardi
+
+
+Notes
+-----
+- Written and tested in Python 3.8.5.
+- Min/max indexed priority queue implementation using a Python list (binary
+  heap) plus a dict mapping each item to its position in the heap.
+- Priority data must be a number; items must be hashable and unique (putting
+  an item already in the queue updates its priority instead of duplicating).
+- Updating an item to a better priority (decrease-key for min, increase-key
+  for max) is O(log n); updating to a worse priority is ignored, which is
+  the behavior wanted by shortest-path searches such as A* and Dijkstra.
+- Items with equal priority are removed in FIFO order (ties are broken by an
+  insertion counter, so items never need to be comparable).
+- The indexed priority queue can be reversed in place (min --> max and
+  viceversa).
+- For a max priority queue the priorities are stored negated; the sign is
+  fixed when the queue is created (or reversed).
+- Examples of usage are at the end of the file.
+- Reference: "Problem Solving with Algorithms and Data Structures", by Miller
+  and Ranum.
+
+
+IndexedPriorityQueue Class
+--------------------------
+queue_type      Priority queue type (min or max).
+items           List with the priority queue data.
+size            Length of the priority queue.
+__init__()      Initializes the priority queue.
+__repr_()       Returns the string representation of the priority queue.
+__contains__()  Checks if an item is in the priority queue.
+is_empty()      Checks if the priority queue is empty or not.
+put()           Adds one item or updates its priority if already queued.
+get()           Returns and removes the item at the front of the priority queue.
+peek()          Returns the item at the front of the priority queue.
+reverse()       Reverses the priority queue (from min to max and viceversa).
+clear()         Removes all items from the priority queue.
+"""
+
+from itertools import count
+
+
+class IndexedPriorityQueue:
+    """
+    Indexed priority queue class using a list and a dict.
+
+    - The list is a binary heap of [priority, counter, item] entries; the
+      dict maps each item to its index in the heap so the entry can be
+      found (and its priority updated) in O(1).
+    - The sift loops are written in Python because the <heapq> module cannot
+      keep the item-to-index dict in sync while it moves entries around.
+    """
+    __slots__ = ('items', 'queue_type', '_sign', '_pos', '_counter')
+
+    def __init__(self, init_list=None, queue_type='min'):
+        """
+        Initializes the indexed priority queue.
+        """
+        self.queue_type = queue_type
+        self._sign = -1 if (queue_type == 'max') else 1
+
+        # Initialize to an empty heap (the counter breaks priority ties in
+        # FIFO order)
+        self.items = []
+        self._pos = {}
+        self._counter = count()
+
+        # Initialize to the initial list (put() resolves duplicate items by
+        # keeping the best priority)
+        if (init_list is not None):
+            for priority, item in init_list:
+                self.put(priority, item)
+
+    def __repr__(self):
+        """
+        Returns the string representation of the indexed priority queue.
+        """
+        sign = self._sign
+        return repr([(sign * p, item) for p, _, item in self.items])
+
+    def __contains__(self, item):
+        """
+        Returns <True> if the item is in the priority queue.
+        """
+        return item in self._pos
+
+    @property
+    def size(self):
+        """
+        Returns the length of the priority queue.
+        """
+        return len(self.items)
+
+    def is_empty(self):
+        """
+        Returns <True> if the priority queue is empty and <False> if it is not.
+        """
+        return not self.items
+
+    def put(self, priority, item):
+        """
+        Adds one item to the priority queue keeping the heap property. If the
+        item is already queued its priority is updated when better (and the
+        entry sifted up) or left unchanged when worse.
+
+        - If min: the lower the number the higher the priority.
+        - If max: the higher the number the higher the priority.
+        """
+        priority = self._sign * priority
+        i = self._pos.get(item)
+
+        # New item: append it at the back and sift it up
+        if (i is None):
+            self._pos[item] = len(self.items)
+            self.items.append([priority, next(self._counter), item])
+            self._sift_up(len(self.items) - 1)
+
+        # Queued item with a better priority: update it and sift it up
+        elif (priority < self.items[i][0]):
+            self.items[i][0] = priority
+            self._sift_up(i)
+
+    def get(self):
+        """
+        Returns and removes the item with the highest priority (the one at the
+        front of the priority queue). Returns <None> if the list is empty.
+        """
+        # If the list is empty
+        if (not self.items):
+            return None
+
+        # Replace the root entry with the last one and sift it down
+        root = self.items[0]
+        last = self.items.pop()
+        if (self.items):
+            self.items[0] = last
+            self._pos[last[2]] = 0
+            self._sift_down(0)
+        del self._pos[root[2]]
+
+        return (self._sign * root[0], root[2])
+
+    def peek(self):
+        """
+        Returns the item with the highest priority (the one at the front of
+        the priority queue) without removing it. Returns <None> if the list
+        is empty.
+        """
+        # If the list is empty
+        if (not self.items):
+            return None
+
+        # If the list is not empty
+        else:
+            priority, _, item = self.items[0]
+            return (self._sign * priority, item)
+
+    def reverse(self):
+        """
+        Reverses the priority queue (from min to max type and viceversa).
+        """
+        self.queue_type = 'min' if (self.queue_type == 'max') else 'max'
+        self._sign = -self._sign
+
+        # Negate the stored priorities and restore the heap property (the
+        # item-to-index dict is kept in sync by the sift loop)
+        for entry in self.items:
+            entry[0] = -entry[0]
+        for i in reversed(range(len(self.items) // 2)):
+            self._sift_down(i)
+
+    def clear(self):
+        """
+        Removes all items from the priority queue.
+        """
+        self.items = []
+        self._pos = {}
+        self._counter = count()
+
+    def _sift_up(self, i):
+        """
+        Moves the entry at index <i> toward the root until its parent is not
+        worse, updating the item-to-index dict along the way.
+        """
+        items = self.items
+        pos = self._pos
+        entry = items[i]
+
+        while (i > 0):
+            parent = (i - 1) >> 1
+            if (entry < items[parent]):
+                items[i] = items[parent]
+                pos[items[i][2]] = i
+                i = parent
+            else:
+                break
+
+        items[i] = entry
+        pos[entry[2]] = i
+
+    def _sift_down(self, i):
+        """
+        Moves the entry at index <i> away from the root until both children
+        are not better, updating the item-to-index dict along the way.
+        """
+        items = self.items
+        pos = self._pos
+        n = len(items)
+        entry = items[i]
+
+        while (True):
+            child = 2 * i + 1
+            if (child >= n):
+                break
+            if (child + 1 < n and items[child + 1] < items[child]):
+                child += 1
+            if (items[child] < entry):
+                items[i] = items[child]
+                pos[items[i][2]] = i
+                i = child
+            else:
+                break
+
+        items[i] = entry
+        pos[entry[2]] = i
+
+
+if __name__ == '__main__':
+    """
+    Tests the IndexedPriorityQueue class
+    """
+    print('\nCreate the indexed priority queue with an initial list')
+    queue = IndexedPriorityQueue([(3, 'a'), (6.4, 'b'), (1.1, 'c'), (4, 'd')])
+    print('- priority queue:', queue)   # [(1.1, 'c'), (4, 'd'), (3, 'a'), (6.4, 'b')]
+    print('- size:', queue.size)        # 4
+    print('- type:', queue.queue_type)  # min
+
+    print('\nCheck membership and peek')
+    print('- is <b> queued?', 'b' in queue)         # True
+    print('- is <z> queued?', 'z' in queue)         # False
+    print('- item at the front:', queue.peek())     # (1.1, 'c')
+
+    print('\nDecrease the priority of a queued item')
+    queue.put(0.5, 'b')
+    print('- priority queue:', queue)       # [(0.5, 'b'), (1.1, 'c'), (3, 'a'), (4, 'd')]
+    print('- item returned:', queue.get())  # (0.5, 'b')
+
+    print('\nTry to worsen the priority of a queued item (no effect)')
+    queue.put(9.9, 'c')
+    print('- priority queue:', queue)   # [(1.1, 'c'), (4, 'd'), (3, 'a')]
+
+    print('\nReverse and get all items plus one')
+    queue.reverse()
+    print('- type:', queue.queue_type)          # max
+    print('- item returned:', queue.get())      # (4, 'd')
+    print('- item returned:', queue.get())      # (3, 'a')
+    print('- item returned:', queue.get())      # (1.1, 'c')
+    print('- item returned:', queue.get())      # None
+
+    print('\nClear and check if empty')
+    queue.clear()
+    print('- priority queue:', queue)           # []
+    print('- empty?', queue.is_empty())         # True
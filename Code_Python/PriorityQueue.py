@@ -9,13 +9,20 @@ Notes
 - Written and tested in Python 3.8.5.
 - Min/max priority queue data structure implementation using Python lists.
 - Priority data must be a number.
-- The priority queue is always ordered (min --> ascending, max --> descending)
-  from the front to the back of the list.
-- Items with equal priority are allowed and removed in FIFO order.
+- The priority queue is stored as a binary heap managed by the C-implemented
+  <heapq> module, with the highest priority item at the front of the list
+  (the rest of the list is in heap order, not fully sorted).
+- Items with equal priority are allowed and removed in FIFO order (ties are
+  broken by an insertion counter, so items never need to be comparable).
 - The priority queue can be reversed in place (min --> max, max --> min).
-- Two dummy items (with priority -inf and +inf) are automatically added when
-  the priority queue is initialized to simplify the binary search.
-- Examples of usage are at the end of the file.
+- For a max priority queue the priorities are stored negated; the sign is
+  fixed when the queue is created (or reversed) so that put/get/peek never
+  branch on the queue type.
+- An alternate backend based on <sortedcontainers.SortedList> can be chosen
+  at creation; it keeps the items fully sorted and adds O(log n) membership
+  checks and removals, at some cost on plain put/get. The module is imported
+  only when this backend is requested.
+- Examples of usage are in <examples/demo_priority_queue.py>.
 - Reference: "Problem Solving with Algorithms and Data Structures", by Miller
   and Ranum.
 
@@ -23,6 +30,7 @@ Notes
 PriorityQueue Class
 -------------------
 queue_type      Priority queue type (min or max).
+backend         Storage backend (heap or sortedlist).
 items           List with the priority queue data.
 size            Length of the priority queue.
 __init__()      Initializes the priority queue.
@@ -35,92 +43,107 @@ reverse()       Reverses the priority queue (from min to max and viceversa).
 clear()         Removes all items from the priority queue.
 """
 
+# Bound once at module level so the hot put/get path resolves them with a
+# single global lookup instead of an attribute access on the module
+from heapq import heapify as _heapify, heappop as _heappop, \
+    heappush as _heappush
+from itertools import count
 
-from math import inf
 
 class PriorityQueue:
     """
     Priority queue class using a list.
 
-    - Two dummy items are added automatically to simplify the binary search.
+    - The list is managed as a binary heap by the <heapq> module.
+    - <__slots__> drops the per-instance dict: smaller objects and faster
+      attribute access.
     """
-    def __init__(self, init_list=None, queue_type='min'):
+    __slots__ = ('items', 'queue_type', 'backend', '_sign', '_counter')
+
+    def __init__(self, init_list=None, queue_type='min', backend='heap'):
         """
         Initializes the priority queue.
         """
         self.queue_type = queue_type
+        self.backend = backend
+        self._sign = -1 if (queue_type == 'max') else 1
+
+        # Build the initial items in one pass (the counter breaks priority
+        # ties in FIFO order)
+        if (init_list is None):
+            items = []
+            self._counter = count()
+        else:
+            sign = self._sign
+            items = [(sign * priority, c, item)
+                     for c, (priority, item) in enumerate(init_list)]
+            self._counter = count(len(items))
 
-        # Initialize to an empty list
-        self.items = [(-inf, 'dummy'), (inf, 'dummy')]
-        if (self.queue_type == 'max'):
-            self.items.reverse()
-        self.size = 0
+        self.items = self._build(items)
 
-        # Initialize to the initial list
-        if (init_list is not None):
-            for priority, item in init_list:
-                self.put(priority, item)
+    def _build(self, items):
+        """
+        Returns the backend container holding the given item list.
+        """
+        if (self.backend == 'sortedlist'):
+            from sortedcontainers import SortedList
+            return SortedList(items)
+
+        # Default heap backend (heapified in C in a single O(n) call)
+        else:
+            _heapify(items)
+            return items
 
     def __repr__(self):
         """
         Returns the string representation of the priority queue.
         """
-        return ("{}".format(self.items[1:-1]))
+        sign = self._sign
+        return repr([(sign * p, item) for p, _, item in self.items])
+
+    @property
+    def size(self):
+        """
+        Returns the length of the priority queue.
+        """
+        return len(self.items)
 
     def is_empty(self):
         """
         Returns <True> if the priority queue is empty and <False> if it is not.
         """
-        return not self.size
+        return not self.items
 
     def put(self, priority, item):
         """
-        Adds one item to the priority queue keeping the priority order.
+        Adds one item to the priority queue keeping the heap property.
 
-        - If min: from the lower to the higher number.
-        - if max: from the higher to the lower number.
+        - If min: the lower the number the higher the priority.
+        - If max: the higher the number the higher the priority.
         """
-        # For any other position in the priority queue use binary search
-        left = 0
-        right = self.size + 1
-
-        # Loop until left with two consecutive items
-        while (right > (left + 1)):
-
-            middle = (left + right) // 2
-            p = self.items[middle][0]
-
-            # Check if the left index needs to be moved
-            if (self.queue_type == 'max'):
-                flag = priority <= p
-            else:
-                flag = priority >= p
-
-            # Move the left/right index
-            if (flag):
-                left = middle           # It is in the right side
-            else:
-                right = middle          # It is in the left side
-
-        # Insert the item between <left> and <right>
-        self.items.insert(right, (priority, item))
-
-        # Increase the priority queue size
-        self.size += 1
+        # Add the item to the backend container (the priority is negated
+        # for a max priority queue)
+        entry = (self._sign * priority, next(self._counter), item)
+        if (self.backend == 'sortedlist'):
+            self.items.add(entry)
+        else:
+            _heappush(self.items, entry)
 
     def get(self):
         """
         Returns and removes the item with the highest priority (the one at the
         front of the priority queue). Returns <None> if the list is empty.
         """
-        # If the list is empty
-        if (self.size == 0):
+        # The empty list is the rare case, so try first and only pay for
+        # the check when the pop actually fails
+        try:
+            if (self.backend == 'sortedlist'):
+                priority, _, item = self.items.pop(0)
+            else:
+                priority, _, item = _heappop(self.items)
+        except IndexError:
             return None
-
-        # If the list is not empty
-        else:
-            self.size -= 1
-            return self.items.pop(1)
+        return (self._sign * priority, item)
 
     def peek(self):
         """
@@ -128,78 +151,26 @@ class PriorityQueue:
         the priority queue) without removing it. Returns <None> if the list
         is empty.
         """
-        # If the list is empty
-        if (self.size == 0):
+        # See get() for why try/except is used instead of a length check
+        try:
+            priority, _, item = self.items[0]
+        except IndexError:
             return None
-
-        # If the list is not empty
-        else:
-            return self.items[1]
+        return (self._sign * priority, item)
 
     def reverse(self):
         """
         Reverses the priority queue (from min to max type and viceversa).
         """
         self.queue_type = 'min' if (self.queue_type == 'max') else 'max'
-        self.items.reverse()
+        self._sign = -self._sign
+
+        # Negate the stored priorities and rebuild the backend container
+        self.items = self._build([(-p, c, item) for p, c, item in self.items])
 
     def clear(self):
         """
         Removes all items from the priority queue.
         """
-        self.items.clear()
-        self.items = [(-inf, 'dummy'), (inf, 'dummy')]
-        if (self.queue_type == 'max'):
-            self.items.reverse()
-        self.size = 0
-
-
-if __name__ == '__main__':
-    """
-    Tests the PriorityQueue class
-    """
-    print('\nCreate the priority queue with an initial list')
-    queue = PriorityQueue([(3, 8), (6.4, 3.3), (1.1, True), (4, 'hello')], 'max')
-    print('- priority queue:', queue)   # [(6.4, 3.3), (4, 'hello'), (3, 8), (1.1, True)]
-    print('- size:', queue.size)        # 4
-    print('- type:', queue.queue_type)  # max
-
-    print('\nClear the priority queue and check if empty')
-    queue.clear()
-    print('- priority queue:', queue)           # []
-    print('- empty?', queue.is_empty())         # True
-
-    print('\nAdd items')
-    queue.put(3, 8)
-    queue.put(6.4, 3.3)
-    queue.put(1.1, True)
-    queue.put(4, 'hello')
-    print('- priority queue:', queue)   # [(6.4, 3.3), (4, 'hello'), (3, 8), (1.1, True)]
-
-    print('\nPeek and get the item')
-    print('- item at the front:', queue.peek())     # (6.4, 3.3)
-    print('- item returned:', queue.get())          # (6.4, 3.3)
-    print('- priority queue:', queue)               # [(4, 'hello'), (3, 8), (1.1, True)]
-
-    print('\nReverse, get one item, and check if empty')
-    queue.reverse()
-    print('- priority queue:', queue)           # [(1.1, True), (3, 8), (4, 'hello')]
-    print('- type:', queue.queue_type)          # min
-    print('- item returned:', queue.get())      # (1.1, True)
-    print('- empty?', queue.is_empty())         # False
-
-    print('\nGet all remaining items plus one')
-    print('- item returned:', queue.get())      # (3, 8)
-    print('- item returned:', queue.get())      # (4, 'hello')
-    print('- item returned:', queue.get())      # None
-    print('- priority queue:', queue)           # []
-    print('- size:', queue.size)                # 0
-
-    print('\nExample of items with same priority')
-    queue.put(3, 8)
-    queue.put(6.4, 3.3)
-    queue.put(1.1, True)
-    queue.put(4, 'hello')
-    queue.put(3, '2nd with 3')
-    queue.put(3, '3rd with 3')
-    print('- priority queue:', queue)   # [(1.1, True), (3, 8), (3, '2nd with 3'), (3, '3rd with 3'), (4, 'hello'), (6.4, 3.3)]
+        self.items = self._build([])
+        self._counter = count()
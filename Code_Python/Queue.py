@@ -7,18 +7,20 @@ Copyright (c) 2020 Gabriele Gilardi
 Notes
 -----
 - Written and tested in Python 3.8.5.
-- Queue data structure implementation using Python lists.
-- The queue is from the front to the back of the list.
+- Queue data structure implementation using <collections.deque>, which has
+  O(1) appends and pops at both ends (a list would shift all its items on
+  every pop from the front).
+- The queue is from the front to the back of the deque.
 - Duplicate items are allowed and removed in FIFO order.
 - The queue can be reversed in place.
-- Examples of usage are at the end of the file.
+- Examples of usage are in <examples/demo_queue.py>.
 - Reference: "Problem Solving with Algorithms and Data Structures", by Miller
   and Ranum.
 
 
 Queue Class
 -----------
-items           List with the queue data.
+items           Deque with the queue data.
 size            Length of the queue.
 __init__()      Initializes the priority queue.
 __repr_()       Returns the string representation of the queue.
@@ -30,42 +32,52 @@ reverse()       Reverses the queue.
 clear()         Removes all items from the queue.
 """
 
+from collections import deque
+
 
 class Queue:
     """
     Queue class using a list.
+
+    - <__slots__> drops the per-instance dict: smaller objects and faster
+      attribute access.
     """
+    __slots__ = ('items',)
+
     def __init__(self, init_list=None):
         """
         Initializes the queue.
         """
-        # Initialize to an empty list
+        # Initialize to an empty deque or to the initial list
         if (init_list is None):
-            self.items = []
-            self.size = 0
+            self.items = deque()
 
-        # Initialize to the initial list         
         else:
-            self.items = init_list
-            self.size = len(init_list)
+            self.items = deque(init_list)
 
     def __repr__(self):
         """
         Returns the string representation of the queue.
         """
-        return ("{}".format(self.items))
+        return repr(list(self.items))
+
+    @property
+    def size(self):
+        """
+        Returns the length of the queue.
+        """
+        return len(self.items)
 
     def is_empty(self):
         """
         Returns <True> if the queue is empty and <False> if it is not.
         """
-        return not self.size
+        return not self.items
 
     def enqueue(self, item):
         """
         Adds one item to the back of the queue.
         """
-        self.size += 1
         self.items.append(item)
 
     def dequeue(self):
@@ -73,27 +85,23 @@ class Queue:
         Returns and removes the item at the front of the queue. Returns <None>
         if the list is empty.
         """
-        # If the list is empty
-        if (self.size == 0):
+        # The empty deque is the rare case, so try first and only pay for
+        # the check when the pop actually fails
+        try:
+            return self.items.popleft()
+        except IndexError:
             return None
 
-        # If the list is not empty
-        else:
-            self.size -= 1
-            return self.items.pop(0)
-
     def peek(self):
         """
         Returns the item at the front of the queue without removing it. Returns
         <None> if the list is empty.
         """
-        # If the list is empty
-        if (self.size == 0):
-            return None
-
-        # If the list is not empty
-        else:
+        # See dequeue() for why try/except is used instead of a length check
+        try:
             return self.items[0]
+        except IndexError:
+            return None
 
     def reverse(self):
         """
@@ -106,44 +114,3 @@ class Queue:
         Removes all items from the queue.
         """
         self.items.clear()
-        self.size = 0
-
-
-if __name__ == '__main__':
-    """
-    Tests the Queue class
-    """
-    print('\nCreate the queue with an initial list')
-    queue = Queue([3, (6.4, 3.3), True, 'hello'])
-    print('- queue:', queue)            # [3, (6.4, 3.3), True, 'hello']
-    print('- size:', queue.size)       # 4
-
-    print('\nClear the queue and check if empty')
-    queue.clear()
-    print('- queue:', queue)                    # []
-    print('- empty?', queue.is_empty())         # True
-
-    print('\nAdd items')
-    queue.enqueue(3)
-    queue.enqueue((6.4, 3.3))
-    queue.enqueue(True)
-    queue.enqueue('hello')
-    print('- queue:', queue)            # [3, (6.4, 3.3), True, 'hello']
-
-    print('\nPeek and pop the item')
-    print('- item at the front:', queue.peek())     # 3
-    print('- item returned:', queue.dequeue())      # 3
-    print('- queue:', queue)                        # [(6.4, 3.3), True, 'hello]
-
-    print('\nReverse, pop one item, and check if empty')
-    queue.reverse()
-    print('- queue:', queue)                        # ['hello', True, (6.4, 3.3)]
-    print('- item returned:', queue.dequeue())      # hello
-    print('- empty?', queue.is_empty())             # False
-
-    print('\nPop all remaining items plus one')
-    print('- item returned:', queue.dequeue())      # True
-    print('- item returned:', queue.dequeue())      # (6.4, 3.3)
-    print('- item returned:', queue.dequeue())      # None
-    print('- queue:', queue)                        # []
-    print('- size:', queue.size)                    # 0
@@ -0,0 +1,58 @@
+"""
+Demo file for the PriorityQueue class in <PriorityQueue.py>.
+
+Copyright (c) 2020 Gabriele Gilardi
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from PriorityQueue import PriorityQueue
+
+print('\nCreate the priority queue with an initial list')
+queue = PriorityQueue([(3, 8), (6.4, 3.3), (1.1, True), (4, 'hello')], 'max')
+print('- priority queue:', queue)   # [(6.4, 3.3), (4, 'hello'), (1.1, True), (3, 8)]
+print('- size:', queue.size)        # 4
+print('- type:', queue.queue_type)  # max
+
+print('\nClear the priority queue and check if empty')
+queue.clear()
+print('- priority queue:', queue)           # []
+print('- empty?', queue.is_empty())         # True
+
+print('\nAdd items')
+queue.put(3, 8)
+queue.put(6.4, 3.3)
+queue.put(1.1, True)
+queue.put(4, 'hello')
+print('- priority queue:', queue)   # [(6.4, 3.3), (4, 'hello'), (1.1, True), (3, 8)]
+
+print('\nPeek and get the item')
+print('- item at the front:', queue.peek())     # (6.4, 3.3)
+print('- item returned:', queue.get())          # (6.4, 3.3)
+print('- priority queue:', queue)               # [(4, 'hello'), (3, 8), (1.1, True)]
+
+print('\nReverse, get one item, and check if empty')
+queue.reverse()
+print('- priority queue:', queue)           # [(1.1, True), (3, 8), (4, 'hello')]
+print('- type:', queue.queue_type)          # min
+print('- item returned:', queue.get())      # (1.1, True)
+print('- empty?', queue.is_empty())         # False
+
+print('\nGet all remaining items plus one')
+print('- item returned:', queue.get())      # (3, 8)
+print('- item returned:', queue.get())      # (4, 'hello')
+print('- item returned:', queue.get())      # None
+print('- priority queue:', queue)           # []
+print('- size:', queue.size)                # 0
+
+print('\nExample of items with same priority')
+queue.put(3, 8)
+queue.put(6.4, 3.3)
+queue.put(1.1, True)
+queue.put(4, 'hello')
+queue.put(3, '2nd with 3')
+queue.put(3, '3rd with 3')
+print('- priority queue:', queue)   # [(1.1, True), (3, '2nd with 3'), (3, 8), (6.4, 3.3), (4, 'hello'), (3, '3rd with 3')]
@@ -0,0 +1,47 @@
+"""
+Demo file for the Queue class in <Queue.py>.
+
+Copyright (c) 2020 Gabriele Gilardi
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from Queue import Queue
+
+print('\nCreate the queue with an initial list')
+queue = Queue([3, (6.4, 3.3), True, 'hello'])
+print('- queue:', queue)            # [3, (6.4, 3.3), True, 'hello']
+print('- size:', queue.size)       # 4
+
+print('\nClear the queue and check if empty')
+queue.clear()
+print('- queue:', queue)                    # []
+print('- empty?', queue.is_empty())         # True
+
+print('\nAdd items')
+queue.enqueue(3)
+queue.enqueue((6.4, 3.3))
+queue.enqueue(True)
+queue.enqueue('hello')
+print('- queue:', queue)            # [3, (6.4, 3.3), True, 'hello']
+
+print('\nPeek and pop the item')
+print('- item at the front:', queue.peek())     # 3
+print('- item returned:', queue.dequeue())      # 3
+print('- queue:', queue)                        # [(6.4, 3.3), True, 'hello]
+
+print('\nReverse, pop one item, and check if empty')
+queue.reverse()
+print('- queue:', queue)                        # ['hello', True, (6.4, 3.3)]
+print('- item returned:', queue.dequeue())      # hello
+print('- empty?', queue.is_empty())             # False
+
+print('\nPop all remaining items plus one')
+print('- item returned:', queue.dequeue())      # True
+print('- item returned:', queue.dequeue())      # (6.4, 3.3)
+print('- item returned:', queue.dequeue())      # None
+print('- queue:', queue)                        # []
+print('- size:', queue.size)                    # 0
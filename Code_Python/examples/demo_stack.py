@@ -0,0 +1,47 @@
+"""
+Demo file for the Stack class in <Stack.py>.
+
+Copyright (c) 2020 Gabriele Gilardi
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from Stack import Stack
+
+print('\nCreate the stack with an initial list')
+stack = Stack([3, (6.4, 3.3), True, 'hello'])
+print('- stack:', stack)            # [3, (6.4, 3.3), True, 'hello']
+print('- size:', stack.size)        # 4
+
+print('\nClear the stack and check if empty')
+stack.clear()
+print('- stack:', stack)                    # []
+print('- empty?', stack.is_empty())         # True
+
+print('\nAdd items')
+stack.push(3)
+stack.push((6.4, 3.3))
+stack.push(True)
+stack.push('hello')
+print('- stack:', stack)            # [3, (6.4, 3.3), True, 'hello']
+
+print('\nPeek and pop the item')
+print('- item at the top:', stack.peek())       # hello
+print('- item returned:', stack.pop())          # hello
+print('- stack:', stack)                        # [3, (6.4, 3.3), True]
+
+print('\nReverse, pop one item, and check if empty')
+stack.reverse()
+print('- stack:', stack)                    # [True, (6.4, 3.3), 3]
+print('- item returned:', stack.pop())      # 3
+print('- empty?', stack.is_empty())         # False
+
+print('\nPop all remaining items plus one')
+print('- item returned:', stack.pop())      # (6.4, 3.3)
+print('- item returned:', stack.pop())      # True
+print('- item returned:', stack.pop())      # None
+print('- stack:', stack)                    # []
+print('- size:', stack.size)                # 0
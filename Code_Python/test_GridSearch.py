@@ -17,11 +17,14 @@ There are three examples:
 import numpy as np
 from GridSearch import GridSearch
 
-np.random.seed(1294404794)
+# Seeded generator for the probabilistic motion in Example 2
+rng = np.random.default_rng(1294404794)
 
-# Directions start from North and move clockwise.
-offset4 = [(-1, 0), (0, 1), (1, 0), (0, -1)]
-offset8 = [(-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1)]
+# Directions start from North and move clockwise (pre-built as arrays so
+# set_motion does not need to convert them).
+offset4 = np.array([(-1, 0), (0, 1), (1, 0), (0, -1)], dtype=np.int8)
+offset8 = np.array([(-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1),
+                    (0, -1), (-1, -1)], dtype=np.int8)
 
 # ===== Example 1 =====
 # The same grid is solved using all four methods
@@ -123,22 +126,23 @@ print('- Positions added:', grid1.added)
 grid2 = GridSearch('simple.txt')
 grid2.set_start(6, 2)
 grid2.set_goal(2, 12)
-grid2.set_motion(offset4, prob=[0.1, 0.1, 0.4, 0.4])
+grid2.set_motion(offset4, prob=np.array([0.1, 0.1, 0.4, 0.4], dtype=np.float32))
+grid2.rng = rng
 
 # Solve using DFS
 """
-     * * * * * * * * * * *     * * *
-      *           · · · · * * * *   *
-* * * *     # #   ·     G           *
-*       · · · ·   ·   * * *     * * *
-*       · # # · · ·   *   *     *
-*       ·             *   *     *
-*   S · ·             *   * * * *
+      * * * * * * * * * * *     * * *
+      *   · · · · · · ·   * * * *   *
+* * * *   · # #       · G           *
+*   · · · ·           * * *     * * *
+*   ·     # #         *   *     *
+*   ·                 *   *     *
+*   S                 *   * * * *
 *                     *
 * * * * * * * * * * * *
-- Steps to goal: 18
-- Positions visited: 19
-- Positions added: 41
+- Steps to goal: 16
+- Positions visited: 17
+- Positions added: 33
 """
 path = grid2.dfs()
 print('\n----- Solved using DFS')